@@ -177,13 +177,16 @@ class LLMQEvoNodesTest(DashTestFramework):
             assert_equal(found, True)
 
     def test_evo_protx_are_in_mnlist(self, evo_protx_list):
-        mn_list = self.nodes[0].masternodelist()
         for evo_protx in evo_protx_list:
+            # Let the node filter the list down to the entry we care about
+            # instead of scanning the full list client-side
+            mn_list = self.nodes[0].masternodelist("json", evo_protx)
             found = False
-            for mn in mn_list:
-                if mn_list.get(mn)['proTxHash'] == evo_protx:
+            for mn in mn_list.values():
+                if mn['proTxHash'] == evo_protx:
                     found = True
-                    assert_equal(mn_list.get(mn)['type'], "Evo")
+                    assert_equal(mn['type'], "Evo")
+                    break
             assert_equal(found, True)
 
     def test_masternode_count(self, expected_mns_count, expected_evo_count):
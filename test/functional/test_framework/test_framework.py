@@ -7,6 +7,7 @@
 
 import configparser
 import copy
+import functools
 from _decimal import Decimal, ROUND_DOWN
 from enum import Enum
 import argparse
@@ -27,7 +28,7 @@ from typing import List
 from .address import ADDRESS_BCRT1_P2SH_OP_TRUE
 from .authproxy import JSONRPCException
 from test_framework.masternodes import check_banned, check_punished
-from test_framework.blocktools import TIME_GENESIS_BLOCK
+from test_framework.blocktools import COINBASE_MATURITY, TIME_GENESIS_BLOCK
 from . import coverage
 from .messages import (
     hash256,
@@ -1135,6 +1136,16 @@ class BitcoinTestFramework(metaclass=BitcoinTestMetaClass):
 
 MASTERNODE_COLLATERAL = 1000
 EVONODE_COLLATERAL = 4000
+# Block subsidy during the first subsidy halving interval on regtest
+INITIAL_BLOCK_REWARD = 500
+
+@functools.lru_cache(maxsize=None)
+def make_platform_node_id(seed):
+    """Derive a deterministic fake platformNodeID (a HASH160) from a seed.
+
+    Memoized so that re-registrations with the same seed skip the
+    pure-Python hashing."""
+    return hash160(b'%d' % seed).hex()
 
 class MasternodeInfo:
     def __init__(self, proTxHash, ownerAddr, votingAddr, rewards_address, operator_reward, pubKeyOperator, keyOperator, collateral_address, collateral_txid, collateral_vout, addr, evo=False):
@@ -1317,7 +1328,7 @@ class DashTestFramework(BitcoinTestFramework):
         voting_address = self.nodes[0].getnewaddress()
         reward_address = self.nodes[0].getnewaddress()
 
-        platform_node_id = hash160(b'%d' % rnd).hex() if rnd is not None else hash160(b'%d' % node_p2p_port).hex()
+        platform_node_id = make_platform_node_id(rnd if rnd is not None else node_p2p_port)
         platform_p2p_port = '%d' % (node_p2p_port + 101)
         platform_http_port = '%d' % (node_p2p_port + 102)
 
@@ -1348,7 +1359,7 @@ class DashTestFramework(BitcoinTestFramework):
         self.bump_mocktime(10 * 60 + 1) # to make tx safe to include in block
         tip = self.generate(self.nodes[0], 1)[0]
 
-        assert_equal(self.nodes[0].getrawtransaction(protx_result, 1, tip)['confirmations'], 1)
+        assert protx_result in self.nodes[0].getblock(tip)['tx']
         mn_info = MasternodeInfo(protx_result, owner_address, voting_address, reward_address, operatorReward, bls['public'], bls['secret'], collateral_address, collateral_txid, collateral_vout, ipAndPort, evo)
         self.mninfo.append(mn_info)
 
@@ -1362,21 +1373,21 @@ class DashTestFramework(BitcoinTestFramework):
 
         # For the sake of the test, generate random nodeid, p2p and http platform values
         r = rnd if rnd is not None else random.randint(21000, 65000)
-        platform_node_id = hash160(b'%d' % r).hex()
+        platform_node_id = make_platform_node_id(r)
         platform_p2p_port = '%d' % (r + 1)
         platform_http_port = '%d' % (r + 2)
 
         fund_txid = self.nodes[0].sendtoaddress(funds_address, 1)
         self.bump_mocktime(10 * 60 + 1) # to make tx safe to include in block
         tip = self.generate(self.nodes[0], 1)[0]
-        assert_equal(self.nodes[0].getrawtransaction(fund_txid, 1, tip)['confirmations'], 1)
+        assert fund_txid in self.nodes[0].getblock(tip)['tx']
 
         protx_success = False
         try:
             protx_result = self.nodes[0].protx('update_service_evo', evo_info.proTxHash, evo_info.addr, evo_info.keyOperator, platform_node_id, platform_p2p_port, platform_http_port, operator_reward_address, funds_address)
             self.bump_mocktime(10 * 60 + 1) # to make tx safe to include in block
             tip = self.generate(self.nodes[0], 1)[0]
-            assert_equal(self.nodes[0].getrawtransaction(protx_result, 1, tip)['confirmations'], 1)
+            assert protx_result in self.nodes[0].getblock(tip)['tx']
             self.log.info("Updated EvoNode %s: platformNodeID=%s, platformP2PPort=%s, platformHTTPPort=%s" % (evo_info.proTxHash, platform_node_id, platform_p2p_port, platform_http_port))
             protx_success = True
         except:
@@ -1511,6 +1522,13 @@ class DashTestFramework(BitcoinTestFramework):
         required_balance = EVONODE_COLLATERAL * self.evo_count
         required_balance += MASTERNODE_COLLATERAL * (self.mn_count - self.evo_count) + 100
         self.log.info("Generating %d coins" % required_balance)
+        # Generate the estimated number of blocks in one shot instead of
+        # polling getbalance() every ten blocks. The subsidy shrinks with
+        # every (on regtest, 150 block) halving interval, so the estimate can
+        # fall short; top up with the old loop if it does.
+        num_blocks = COINBASE_MATURITY + (required_balance + INITIAL_BLOCK_REWARD - 1) // INITIAL_BLOCK_REWARD
+        self.bump_mocktime(1)
+        self.generate(self.nodes[0], num_blocks, sync_fun=self.no_op)
         while self.nodes[0].getbalance() < required_balance:
             self.bump_mocktime(1)
             self.generate(self.nodes[0], 10, sync_fun=self.no_op)
@@ -7,12 +7,13 @@ from collections import namedtuple
 
 from test_framework.address import (
     byte_to_base58,
-    key_to_p2pkh,
+    keyhash_to_p2pkh,
     script_to_p2sh,
 )
 from test_framework.key import ECKey
+from test_framework.script import hash160
 from test_framework.script_util import (
-    key_to_p2pkh_script,
+    keyhash_to_p2pkh_script,
     keys_to_multisig_script,
     script_to_p2sh_script,
 )
@@ -34,10 +35,12 @@ def get_key(node):
     Returns a named tuple of privkey, pubkey and all address and scripts."""
     addr = node.getnewaddress()
     pubkey = node.getaddressinfo(addr)['pubkey']
+    # Hash the pubkey once and share the result between script and address
+    pubkey_hash = hash160(bytes.fromhex(pubkey))
     return Key(privkey=node.dumpprivkey(addr),
                pubkey=pubkey,
-               p2pkh_script=key_to_p2pkh_script(pubkey).hex(),
-               p2pkh_addr=key_to_p2pkh(pubkey))
+               p2pkh_script=keyhash_to_p2pkh_script(pubkey_hash).hex(),
+               p2pkh_addr=keyhash_to_p2pkh(pubkey_hash))
 
 def get_generate_key():
     """Generate a fresh key
@@ -47,23 +50,25 @@ def get_generate_key():
     eckey.generate()
     privkey = bytes_to_wif(eckey.get_bytes())
     pubkey = eckey.get_pubkey().get_bytes().hex()
+    pubkey_hash = hash160(bytes.fromhex(pubkey))
     return Key(privkey=privkey,
                pubkey=pubkey,
-               p2pkh_script=key_to_p2pkh_script(pubkey).hex(),
-               p2pkh_addr=key_to_p2pkh(pubkey))
+               p2pkh_script=keyhash_to_p2pkh_script(pubkey_hash).hex(),
+               p2pkh_addr=keyhash_to_p2pkh(pubkey_hash))
 
 def get_multisig(node):
     """Generate a fresh 2-of-3 multisig on node
 
     Returns a named tuple of privkeys, pubkeys and all address and scripts."""
-    addrs = []
-    pubkeys = []
-    for _ in range(3):
-        addr = node.getaddressinfo(node.getnewaddress())
-        addrs.append(addr['address'])
-        pubkeys.append(addr['pubkey'])
+    # Issue each round of identical calls as a single JSON-RPC batch to avoid
+    # paying one HTTP round-trip per call.
+    new_addrs = node.batch([node.getnewaddress.get_request() for _ in range(3)])
+    addr_infos = node.batch([node.getaddressinfo.get_request(resp['result']) for resp in new_addrs])
+    addrs = [resp['result']['address'] for resp in addr_infos]
+    pubkeys = [resp['result']['pubkey'] for resp in addr_infos]
     script_code = keys_to_multisig_script(pubkeys, k=2)
-    return Multisig(privkeys=[node.dumpprivkey(addr) for addr in addrs],
+    privkeys = node.batch([node.dumpprivkey.get_request(addr) for addr in addrs])
+    return Multisig(privkeys=[resp['result'] for resp in privkeys],
                     pubkeys=pubkeys,
                     p2sh_script=script_to_p2sh_script(script_code).hex(),
                     p2sh_addr=script_to_p2sh(script_code),
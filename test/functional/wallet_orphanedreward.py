@@ -4,6 +4,7 @@
 # file COPYING or http://www.opensource.org/licenses/mit-license.php.
 """Test orphaned block rewards in the wallet."""
 
+from test_framework.blocktools import COINBASE_MATURITY
 from test_framework.test_framework import BitcoinTestFramework
 from test_framework.util import assert_equal
 from decimal import Decimal
@@ -19,9 +20,9 @@ class OrphanedBlockRewardTest(BitcoinTestFramework):
     def run_test(self):
         # Generate some blocks and obtain some coins on node 0.  We send
         # some balance to node 1, which will hold it as a single coin.
-        self.generate(self.nodes[0], 150)
+        self.generate(self.nodes[0], COINBASE_MATURITY + 1, sync_fun=self.no_op)
         self.nodes[0].sendtoaddress(self.nodes[1].getnewaddress(), 10)
-        self.generate(self.nodes[0], 1)
+        self.generate(self.nodes[0], 1, sync_fun=self.no_op)
 
         # Get a block reward with node 1 and remember the block so we can orphan
         # it later.
@@ -30,14 +31,16 @@ class OrphanedBlockRewardTest(BitcoinTestFramework):
 
         # Let the block reward mature and send coins including both
         # the existing balance and the block reward.
-        self.generate(self.nodes[0], 150)
-        assert_equal(self.nodes[1].getbalance(), Decimal("474.28571429"))
+        self.generate(self.nodes[0], COINBASE_MATURITY)
+        assert_equal(self.nodes[1].getbalance(), Decimal("510.00000000"))
         txid = self.nodes[1].sendtoaddress(self.nodes[0].getnewaddress(), 30)
 
         # Orphan the block reward and make sure that the original coins
         # from the wallet can still be spent.
         self.nodes[0].invalidateblock(blk)
-        self.generate(self.nodes[0], 152)
+        # Mine just enough blocks for node 0's chain to overtake node 1's and
+        # for the replaced coinbases to mature.
+        self.generate(self.nodes[0], COINBASE_MATURITY + 2)
         # Without the following abandontransaction call, the coins are
         # not considered available yet.
         assert_equal(self.nodes[1].getbalances()["mine"], {